@@ -1,189 +1,616 @@
+import argparse
+import csv
+import functools
+import json
+import linecache
 import math
+import numpy as np
+import os
 import sympy as sp
 import sys
 
+# Set ZOF_BACKEND=numba to compile the solver loops and functions with numba.
+# Each new function then costs tens of milliseconds of JIT, so it only pays off
+# for long runs. ZOF_BACKEND=autowrap compiles each function to a C extension
+# with Cython instead; building costs a few seconds per expression
+ZOF_BACKEND = os.environ.get('ZOF_BACKEND', '').lower()
+
+numba = None
+if ZOF_BACKEND == 'numba':
+    try:
+        import numba
+    except ImportError:
+        print("numba is not installed, using the default backends.", file=sys.stderr)
+
+try:
+    import symengine as se
+except ImportError:
+    se = None
+
+# The variable input functions are written in
+X_SYM = sp.symbols('x')
+
+# symengine's LLVM visitor has a fixed per-call cost of a few microseconds, so
+# it only beats a lambdified function once the expression is fairly large
+SYMENGINE_MIN_OPS = 100
+
+# Expanded polynomials from this degree up are evaluated in Horner form: n
+# multiply-adds instead of a power per term
+HORNER_MIN_DEGREE = 4
+
 # --- Helper Functions for Math ---
 
+if numba is not None:
+    # Argument types of the solver kernels. Functions are passed as first-class
+    # function values, so one compiled kernel serves every expression
+    _KERNEL_TYPES = {
+        'f': numba.types.FunctionType(numba.float64(numba.float64)),
+        'fdf': numba.types.FunctionType(numba.types.UniTuple(numba.float64, 2)(numba.float64)),
+        'float': numba.float64,
+        'int': numba.int64,
+    }
+
+def _kernel_signature(*arg_types):
+    """Records the argument types (keys of _KERNEL_TYPES) of a solver kernel.
+
+    The kernel stays a plain Python function; with numba, _run_kernel compiles
+    it for these types on first use.
+    """
+    def decorate(func):
+        func.arg_types = arg_types
+        return func
+    return decorate
+
+@functools.lru_cache(maxsize=None)
+def _compiled_kernel(kernel):
+    """Compiles a solver kernel for its declared argument types.
+
+    The signature never changes, so numba's on-disk cache holds one entry per
+    kernel and later processes load it instead of compiling again.
+    """
+    return numba.njit(tuple(_KERNEL_TYPES[name] for name in kernel.arg_types), cache=True)(kernel)
+
+def _lambdify_and_clean(args, expr, **kwargs):
+    """sp.lambdify, minus the generated source it leaves in linecache.
+
+    lambdify registers each generated function's source in linecache.cache,
+    which otherwise grows with every distinct expression compiled.
+    """
+    f = sp.lambdify(args, expr, **kwargs)
+    linecache.cache.pop(f.__code__.co_filename, None)
+    return f
+
+def _autowrap(expr):
+    """Compiles a sympy expression in x into a C extension via Cython."""
+    from sympy.utilities.autowrap import autowrap
+    # With no tempdir, sympy builds in a fresh temporary directory and removes
+    # it once the module is imported, so builds leave nothing behind
+    return autowrap(expr, backend='cython', args=(X_SYM,))
+
+def _to_horner(expr):
+    """Rewrites an expanded polynomial in x of degree >= HORNER_MIN_DEGREE in Horner form.
+
+    Factored forms like (x-1)**3 are left alone, since expanding them loses
+    accuracy near their roots.
+    """
+    if expr.is_polynomial(X_SYM) and sp.degree(expr, X_SYM) >= HORNER_MIN_DEGREE and expr == sp.expand(expr):
+        return sp.horner(expr)
+    return expr
+
+def _fold_constants(expr):
+    """Evaluates the irrational constant subexpressions of expr to floats."""
+    return expr.replace(lambda e: e.is_number and not e.is_Rational, lambda e: e.evalf())
+
+def _make_callable(*exprs):
+    """Turns sympy expressions in x into one numerical callable.
+
+    Given several expressions the callable returns a tuple of their values,
+    evaluated together so common subexpressions are only computed once.
+    """
+    # Fold constant subterms like sin(1)*exp(2) into floats once, here,
+    # instead of re-evaluating them on every call. Rationals stay exact, so
+    # sqrt(x) isn't turned into x**0.5, which is complex for negative x
+    exprs = [_to_horner(_fold_constants(expr)) for expr in exprs]
+    body = exprs[0] if len(exprs) == 1 else tuple(exprs)
+    if ZOF_BACKEND == 'autowrap':
+        try:
+            wrapped = [_autowrap(expr) for expr in exprs]
+            if len(wrapped) == 1:
+                return wrapped[0]
+            return lambda v: tuple(g(v) for g in wrapped)
+        except Exception as e:
+            print(f"autowrap failed ({e}), using the default backends.", file=sys.stderr)
+    if numba is not None:
+        try:
+            # The math backend produces plain scalar code that numba can compile,
+            # which lets the solver kernels call it without leaving machine code
+            ret = numba.float64 if len(exprs) == 1 else numba.types.UniTuple(numba.float64, len(exprs))
+            return numba.njit(ret(numba.float64))(_lambdify_and_clean(X_SYM, body, modules='math', cse=True))
+        except Exception:
+            pass  # Not supported by numba, try the other backends
+    if se is not None and sum(sp.count_ops(expr) for expr in exprs) >= SYMENGINE_MIN_OPS:
+        try:
+            visitor = se.Lambdify([se.Symbol('x')], [se.sympify(expr) for expr in exprs], backend='llvm', cse=True)
+            if len(exprs) == 1:
+                return lambda v: visitor([v])[0]
+            return lambda v: tuple(visitor([v]))
+        except Exception:
+            pass  # Not supported by symengine/LLVM, use sympy below
+    return _lambdify_and_clean(X_SYM, body, modules='math', cse=True)
+
+@functools.lru_cache(maxsize=256)
+def _compile_function(expr_str):
+    """Sympifies and compiles an expression string, memoized by the raw string."""
+    expr = sp.sympify(expr_str)
+    return _make_callable(expr), expr
+
 def parse_function(expr_str):
     """Parses a string expression into a callable function."""
-    x = sp.symbols('x')
     try:
-        # Sympy sympify converts string to sympy expression
-        expr = sp.sympify(expr_str)
-        # Lambdify makes it a fast python function
-        f = sp.lambdify(x, expr, modules=['numpy', 'math'])
-        return f, expr
+        # Cached, so re-entering the same function skips sympify/lambdify
+        return _compile_function(expr_str)
     except Exception as e:
-        print(f"Error parsing function: {e}")
+        print(f"Error parsing function: {e}", file=sys.stderr)
         return None, None
 
+@functools.lru_cache(maxsize=256)
 def get_derivative(expr):
-    """Computes the derivative of a sympy expression."""
-    x = sp.symbols('x')
-    diff_expr = sp.diff(expr, x)
-    return sp.lambdify(x, diff_expr, modules=['numpy', 'math'])
+    """Computes the derivative of a sympy expression.
+
+    Returns a single callable giving (f(x), f'(x)), so Newton-Raphson gets
+    both values from one call that shares their common subexpressions.
+    """
+    diff_expr = sp.diff(expr, X_SYM)
+    return _make_callable(expr, diff_expr)
 
 # --- Numerical Methods ---
+# Each method is a loop kernel that records its iterations into a
+# (columns x iterations) table and returns (ok, root, iters_used, table), so that
+# numba can compile it. The public wrappers return the history as named columns.
 
-def bisection(f, a, b, tol, max_iter):
-    if f(a) * f(b) >= 0:
-        return None, "Bisection fails: f(a) and f(b) must have opposite signs."
-    
-    iterations = []
-    for i in range(1, max_iter + 1):
+def _run_kernel(kernel, *args):
+    """Runs the compiled kernel when every function argument is jitted, else the Python one."""
+    funcs = [arg for arg in args if callable(arg)]
+    if numba is not None and all(isinstance(fn, numba.core.dispatcher.Dispatcher) for fn in funcs):
+        kernel = _compiled_kernel(kernel)
+    return kernel(*args)
+
+# Iteration tables start with at most this many columns and double as needed,
+# so a large max_iter doesn't allocate its whole history up front
+HISTORY_BLOCK = 1024
+
+def _jitable(func):
+    """Makes a plain helper callable from the numba-compiled kernels too."""
+    if numba is None:
+        return func
+    return numba.extending.register_jitable(func)
+
+@_jitable
+def _new_table(ncols, max_iter):
+    return np.empty((ncols, min(max_iter, HISTORY_BLOCK)))
+
+@_jitable
+def _grown(table):
+    """Returns a copy of table with twice the columns."""
+    bigger = np.empty((table.shape[0], 2 * table.shape[1]))
+    bigger[:, :table.shape[1]] = table
+    return bigger
+
+def _history(names, table, n):
+    """Maps column names to the first n iterations of a kernel table."""
+    return {'iter': np.arange(1, n + 1), **dict(zip(names, table[:, :n]))}
+
+@_kernel_signature('f', 'float', 'float', 'float', 'int')
+def _bisection_kernel(f, a, b, tol, max_iter):
+    table = _new_table(5, max_iter)
+    # f(a) only changes when a does, so carry it instead of re-evaluating
+    fa = f(a)
+    for i in range(max_iter):
         c = (a + b) / 2
         fc = f(c)
         error = abs(b - a)
-        
-        iterations.append({
-            'iter': i, 'a': a, 'b': b, 'mid': c, 'f_mid': fc, 'error': error
-        })
-        
-        if abs(fc) < tol or error < tol:
-            return c, iterations
-        
-        if f(a) * fc < 0:
-            b = c
-        else:
-            a = c
-            
-    return (a + b) / 2, iterations
+        if i == table.shape[1]:
+            table = _grown(table)
+        table[0, i] = a
+        table[1, i] = b
+        table[2, i] = c
+        table[3, i] = fc
+        table[4, i] = error
 
-def regula_falsi(f, a, b, tol, max_iter):
+        # Stop on a small residual or a narrow bracket, in one comparison
+        if min(abs(fc), error) < tol:
+            return True, c, i + 1, table
+
+        # Select rather than branch: the sign pattern is irregular, and numba
+        # can lower these to conditional moves
+        left = fa * fc < 0
+        b = c if left else b
+        a = a if left else c
+        fa = fa if left else fc
+
+    return True, (a + b) / 2, max_iter, table
+
+def bisection(f, a, b, tol, max_iter):
     if f(a) * f(b) >= 0:
-        return None, "Regula Falsi fails: f(a) and f(b) must have opposite signs."
-        
-    iterations = []
-    for i in range(1, max_iter + 1):
-        fa = f(a)
-        fb = f(b)
-        
+        return None, "Bisection fails: f(a) and f(b) must have opposite signs."
+
+    ok, root, n, table = _run_kernel(_bisection_kernel, f, float(a), float(b), tol, max_iter)
+    return root, _history(('a', 'b', 'mid', 'f_mid', 'error'), table, n)
+
+@_kernel_signature('f', 'float', 'float', 'float', 'int')
+def _regula_falsi_kernel(f, a, b, tol, max_iter):
+    table = _new_table(5, max_iter)
+    c = a
+    # Only the endpoint that moves needs re-evaluating, so carry f(a) and f(b)
+    fa = f(a)
+    fb = f(b)
+    for i in range(max_iter):
         # Formula: c = (a*f(b) - b*f(a)) / (f(b) - f(a))
         if (fb - fa) == 0:
-            return None, "Division by zero encountered."
-            
+            return False, c, i, table
+
         c = (a * fb - b * fa) / (fb - fa)
         fc = f(c)
         error = abs(fc) # Using functional value as error proxy for bracketing methods often
-        
-        iterations.append({
-            'iter': i, 'a': a, 'b': b, 'c': c, 'f_c': fc, 'error': error
-        })
-        
+        if i == table.shape[1]:
+            table = _grown(table)
+        table[0, i] = a
+        table[1, i] = b
+        table[2, i] = c
+        table[3, i] = fc
+        table[4, i] = error
+
         if abs(fc) < tol:
-            return c, iterations
-            
-        if f(a) * fc < 0:
-            b = c
+            return True, c, i + 1, table
+
+        if fa * fc < 0:
+            b, fb = c, fc
         else:
-            a = c
-    return c, iterations
+            a, fa = c, fc
+    return True, c, max_iter, table
 
-def secant(f, x0, x1, tol, max_iter):
-    iterations = []
-    for i in range(1, max_iter + 1):
+def regula_falsi(f, a, b, tol, max_iter):
+    if f(a) * f(b) >= 0:
+        return None, "Regula Falsi fails: f(a) and f(b) must have opposite signs."
+
+    ok, root, n, table = _run_kernel(_regula_falsi_kernel, f, float(a), float(b), tol, max_iter)
+    if not ok:
+        return None, "Division by zero encountered."
+    return root, _history(('a', 'b', 'c', 'f_c', 'error'), table, n)
+
+@_kernel_signature('f', 'float', 'float', 'float', 'int')
+def _secant_kernel(f, x0, x1, tol, max_iter):
+    table = _new_table(4, max_iter)
+    for i in range(max_iter):
         fx0 = f(x0)
         fx1 = f(x1)
-        
+
         if (fx1 - fx0) == 0:
-             return None, "Division by zero: f(x1) - f(x0) is zero."
-        
+            return False, x1, i, table
+
         x2 = x1 - (fx1 * (x1 - x0)) / (fx1 - fx0)
         error = abs(x2 - x1)
-        
-        iterations.append({
-            'iter': i, 'x_prev': x0, 'x_curr': x1, 'x_new': x2, 'error': error
-        })
-        
+        if i == table.shape[1]:
+            table = _grown(table)
+        table[0, i] = x0
+        table[1, i] = x1
+        table[2, i] = x2
+        table[3, i] = error
+
         if error < tol:
-            return x2, iterations
-            
+            return True, x2, i + 1, table
+
         x0 = x1
         x1 = x2
-        
-    return x1, iterations
 
-def newton_raphson(f, df, x0, tol, max_iter):
-    iterations = []
+    return True, x1, max_iter, table
+
+def secant(f, x0, x1, tol, max_iter):
+    ok, root, n, table = _run_kernel(_secant_kernel, f, float(x0), float(x1), tol, max_iter)
+    if not ok:
+        return None, "Division by zero: f(x1) - f(x0) is zero."
+    return root, _history(('x_prev', 'x_curr', 'x_new', 'error'), table, n)
+
+@_kernel_signature('fdf', 'float', 'float', 'int')
+def _newton_raphson_kernel(fdf, x0, tol, max_iter):
+    table = _new_table(5, max_iter)
     x_curr = x0
-    
-    for i in range(1, max_iter + 1):
-        fx = f(x_curr)
-        dfx = df(x_curr)
-        
+
+    for i in range(max_iter):
+        fx, dfx = fdf(x_curr)
+
         if dfx == 0:
-            return None, "Derivative is zero. Method fails."
-            
+            return False, x_curr, i, table
+
         x_next = x_curr - (fx / dfx)
         error = abs(x_next - x_curr)
-        
-        iterations.append({
-            'iter': i, 'x_curr': x_curr, 'f_x': fx, 'df_x': dfx, 'x_next': x_next, 'error': error
-        })
-        
+        if i == table.shape[1]:
+            table = _grown(table)
+        table[0, i] = x_curr
+        table[1, i] = fx
+        table[2, i] = dfx
+        table[3, i] = x_next
+        table[4, i] = error
+
         if error < tol:
-            return x_next, iterations
-            
+            return True, x_next, i + 1, table
+
         x_curr = x_next
-        
-    return x_curr, iterations
 
-def fixed_point(g, x0, tol, max_iter):
-    # Note: User inputs g(x) where x = g(x)
-    iterations = []
+    return True, x_curr, max_iter, table
+
+def newton_raphson(fdf, x0, tol, max_iter):
+    # fdf(x) returns (f(x), f'(x)), see get_derivative
+    ok, root, n, table = _run_kernel(_newton_raphson_kernel, fdf, float(x0), tol, max_iter)
+    if not ok:
+        return None, "Derivative is zero. Method fails."
+    return root, _history(('x_curr', 'f_x', 'df_x', 'x_next', 'error'), table, n)
+
+@_kernel_signature('f', 'float', 'float', 'int')
+def _fixed_point_kernel(g, x0, tol, max_iter):
+    table = _new_table(4, max_iter)
+    x_prev = np.nan
     x_curr = x0
-    
-    for i in range(1, max_iter + 1):
+    acc_prev = np.nan
+
+    for i in range(max_iter):
         x_next = g(x_curr)
-        error = abs(x_next - x_curr)
-        
-        iterations.append({
-            'iter': i, 'x_curr': x_curr, 'g_x': x_next, 'error': error
-        })
-        
-        if error < tol:
-            return x_next, iterations
-            
+        # Aitken's delta-squared extrapolation of the last three plain iterates,
+        # which reaches the fixed point long before they do when convergence is
+        # linear. The iteration itself stays x_{n+1} = g(x_n)
+        denom = x_next - 2 * x_curr + x_prev
+        if denom == 0:
+            x_acc = x_next
+        else:
+            x_acc = x_prev - (x_curr - x_prev) ** 2 / denom
+        step = abs(x_next - x_curr)
+        acc_step = abs(x_acc - acc_prev)  # NaN until two estimates exist
+        error = acc_step if acc_step < step else step
+        if i == table.shape[1]:
+            table = _grown(table)
+        table[0, i] = x_curr
+        table[1, i] = x_next
+        table[2, i] = x_acc
+        table[3, i] = error
+
+        if step < tol:
+            return True, x_next, i + 1, table
+        if acc_step < tol:
+            return True, x_acc, i + 1, table
+
+        x_prev = x_curr
         x_curr = x_next
-        
+        acc_prev = x_acc
+
         # Safety break for divergence
-        if error > 1e10:
-            return None, "Method diverged."
-            
-    return x_curr, iterations
+        if step > 1e10:
+            return False, x_curr, i + 1, table
 
-def modified_secant(f, x0, delta, tol, max_iter):
-    iterations = []
+    return True, x_curr, max_iter, table
+
+def fixed_point(g, expr, x0, tol, max_iter):
+    # Note: User inputs g(x) where x = g(x)
+    # |g'(x0)| >= 1 means g isn't a contraction around the starting point, so
+    # refuse up front instead of iterating max_iter times to find out
+    try:
+        slope = abs(float(sp.diff(expr, X_SYM).subs(X_SYM, x0)))
+    except (TypeError, ValueError):
+        slope = None  # g'(x0) isn't a real number; let the iteration decide
+    if slope is not None and slope >= 1:
+        return None, f"Likely divergent: |g'(x0)| = {slope:.4g} >= 1, provide a contractive g(x)."
+
+    ok, root, n, table = _run_kernel(_fixed_point_kernel, g, float(x0), tol, max_iter)
+    if not ok:
+        return None, "Method diverged."
+    return root, _history(('x_curr', 'g_x', 'x_acc', 'error'), table, n)
+
+@_kernel_signature('f', 'float', 'float', 'float', 'int')
+def _modified_secant_kernel(f, x0, delta, tol, max_iter):
+    table = _new_table(3, max_iter)
     x_curr = x0
-    
-    for i in range(1, max_iter + 1):
+
+    for i in range(max_iter):
         fx = f(x_curr)
         fx_delta = f(x_curr + delta)
-        
+
         if (fx_delta - fx) == 0:
-            return None, "Division by zero in Modified Secant."
-            
-        # Formula: x_next = x - (delta * x * f(x)) / (f(x + delta*x) - f(x)) 
+            return False, x_curr, i, table
+
+        # Formula: x_next = x - (delta * x * f(x)) / (f(x + delta*x) - f(x))
         # Standard modified secant usually uses a small perturbation delta
         # x_{i+1} = x_i - (delta * f(x_i)) / (f(x_i + delta) - f(x_i))
-        
+
         x_next = x_curr - (delta * fx) / (fx_delta - fx)
         error = abs(x_next - x_curr)
-        
-        iterations.append({
-            'iter': i, 'x_curr': x_curr, 'x_next': x_next, 'error': error
-        })
-        
+        if i == table.shape[1]:
+            table = _grown(table)
+        table[0, i] = x_curr
+        table[1, i] = x_next
+        table[2, i] = error
+
         if error < tol:
-            return x_next, iterations
-            
+            return True, x_next, i + 1, table
+
         x_curr = x_next
-        
-    return x_curr, iterations
+
+    return True, x_curr, max_iter, table
+
+def modified_secant(f, x0, delta, tol, max_iter):
+    ok, root, n, table = _run_kernel(_modified_secant_kernel, f, float(x0), float(delta), tol, max_iter)
+    if not ok:
+        return None, "Division by zero in Modified Secant."
+    return root, _history(('x_curr', 'x_next', 'error'), table, n)
+
+# Observed convergence order below which the secant is considered stalled
+STALL_ORDER = 1.2
+
+def _convergence_order(errors):
+    """Estimates the order q from the last three step sizes, e_{k+1} ~ e_k**q."""
+    e1, e2, e3 = errors[-3:]
+    # Growing steps mean the iteration hasn't settled near a root yet, and any
+    # order estimated from them is meaningless
+    if not e1 > e2 > e3 > 0:
+        return None
+    return math.log(e3 / e2) / math.log(e2 / e1)
+
+def auto_solve(f, expr, x0, x1, tol, max_iter):
+    """Secant iteration that adapts to the function.
+
+    Switches to Newton-Raphson when the observed convergence order drops below
+    STALL_ORDER. Once two iterates straddle a root, any step that leaves that
+    bracket, or follows a step where |f| grew, is replaced by a bisection step.
+    Before that, a Newton step that makes |f| grow is rejected and the secant
+    iteration resumes for the rest of the run.
+    """
+    history = {'iter': [], 'method': [], 'x_curr': [], 'x_next': [], 'f_next': [], 'error': []}
+    errors = []
+    method = 'secant'
+    fx0, fx1 = f(x0), f(x1)
+    bracket = (x0, fx0, x1, fx1) if fx0 * fx1 < 0 else None
+    grew = False
+    newton_ok = True
+
+    for i in range(1, max_iter + 1):
+        if method == 'newton':
+            fx, dfx = fdf(x1)
+            if dfx == 0:
+                return None, "Derivative is zero. Method fails."
+            x_next = x1 - (fx / dfx)
+        else:
+            if (fx1 - fx0) == 0:
+                return None, "Division by zero: f(x1) - f(x0) is zero."
+            x_next = x1 - (fx1 * (x1 - x0)) / (fx1 - fx0)
+        error = abs(x_next - x1)
+
+        step = method
+        if bracket is not None:
+            a, fa, b, fb = bracket
+            if grew or not min(a, b) <= x_next <= max(a, b):
+                step = 'bisection'
+                x_next = (a + b) / 2
+                error = abs(b - a) / 2
+        f_next = f(x_next)
+
+        for name, value in zip(history, (i, step, x1, x_next, f_next, error)):
+            history[name].append(value)
+
+        # An exact zero would otherwise be lost from the bracket below
+        if error < tol or f_next == 0:
+            return x_next, history
+
+        grew = step != 'bisection' and abs(f_next) > abs(fx1)
+        if grew and step == 'newton' and bracket is None and fx1 * f_next > 0:
+            # Nothing to bisect yet: drop the Newton step and return to the
+            # secant from the last two points, without switching again
+            history['method'][-1] = 'rejected'
+            method, newton_ok, errors = 'secant', False, []
+            continue
+        if bracket is not None:
+            bracket = (a, fa, x_next, f_next) if fa * f_next < 0 else (x_next, f_next, b, fb)
+        elif fx1 * f_next < 0:
+            bracket = (x1, fx1, x_next, f_next)
+
+        # Bisection steps say nothing about the method's own convergence order
+        errors = errors + [error] if step == method else []
+        if method == 'secant' and newton_ok and len(errors) >= 3:
+            q = _convergence_order(errors)
+            if q is not None and q < STALL_ORDER:
+                method = 'newton'
+                fdf = get_derivative(expr)
+
+        x0, fx0 = x1, fx1
+        x1, fx1 = x_next, f_next
+
+    return x1, history
+
+# --- Dispatch ---
+
+# Inputs each method needs besides the function, tolerance and max iterations
+METHOD_PARAMS = {
+    '1': ('a', 'b'), '2': ('a', 'b'), '3': ('x0', 'x1'), '4': ('x0',),
+    '5': ('x0',), '6': ('x0', 'delta'), '7': ('x0', 'x1'),
+}
+
+def dispatch(method, func_str, params):
+    """Runs one method on func_str.
+
+    params maps 'tol', 'max_iter' and the method's METHOD_PARAMS names to values
+    (numbers or numeric strings). Returns (root, history), or (None, error message).
+    """
+    if method not in METHOD_PARAMS:
+        return None, f"Unknown method {method!r}."
+    for name in ('tol', 'max_iter') + METHOD_PARAMS[method]:
+        if params.get(name) in (None, ''):
+            return None, f"Missing input {name!r} for method {method}."
+    f, expr = parse_function(func_str)
+    if f is None:
+        return None, "Invalid function."
+    tol = float(params['tol'])
+    max_iter = int(params['max_iter'])
+    p = {name: float(params[name]) for name in METHOD_PARAMS[method]}
+
+    if method == '1': # Bisection
+        return bisection(f, p['a'], p['b'], tol, max_iter)
+    elif method == '2': # Regula Falsi
+        return regula_falsi(f, p['a'], p['b'], tol, max_iter)
+    elif method == '3': # Secant
+        return secant(f, p['x0'], p['x1'], tol, max_iter)
+    elif method == '4': # Newton Raphson
+        return newton_raphson(get_derivative(expr), p['x0'], tol, max_iter)
+    elif method == '5': # Fixed Point
+        return fixed_point(f, expr, p['x0'], tol, max_iter)
+    elif method == '6': # Modified Secant
+        return modified_secant(f, p['x0'], p['delta'], tol, max_iter)
+    elif method == '7': # Auto
+        return auto_solve(f, expr, p['x0'], p['x1'], tol, max_iter)
+
+# --- Batch Mode ---
+
+def read_problems(path):
+    """Yields one dict per problem from a CSV file (with a header row) or JSON lines.
+
+    Fields: method, function, tol, max_iter, plus the method's inputs
+    (a, b, x0, x1, delta). '-' reads CSV from stdin.
+    """
+    if path == '-':
+        yield from csv.DictReader(sys.stdin)
+        return
+    with open(path, newline='') as fh:
+        if path.endswith(('.jsonl', '.json')):
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(fh)
+
+def run_batch(path):
+    """Solves every problem in path, writing one CSV result row per problem."""
+    writer = csv.writer(sys.stdout)
+    writer.writerow(['method', 'function', 'root', 'iterations', 'error'])
+    for problem in read_problems(path):
+        method = str(problem.get('method', '')).strip()
+        func_str = problem.get('function', '')
+        try:
+            result, history = dispatch(method, func_str, problem)
+        except Exception as e:
+            result, history = None, str(e)
+        if result is None:
+            writer.writerow([method, func_str, '', '', history])
+        else:
+            writer.writerow([method, func_str, repr(float(result)), len(history['iter']), ''])
 
 # --- Main CLI Loop ---
 
 def main():
+    parser = argparse.ArgumentParser(description="Zero of Functions (ZOF) solver.")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="solve the problems in a CSV or JSON-lines file ('-' for CSV on stdin) "
+                             "instead of prompting; columns: method, function, tol, max_iter, a, b, x0, x1, delta")
+    args = parser.parse_args()
+    if args.batch:
+        run_batch(args.batch)
+        return
+
     print("========================================")
     print("   ZERO OF FUNCTIONS (ZOF) SOLVER CLI   ")
     print("========================================")
@@ -196,15 +623,16 @@ def main():
         print("4. Newton-Raphson Method")
         print("5. Fixed Point Iteration")
         print("6. Modified Secant Method")
+        print("7. Auto (Secant, switching to Newton/Bisection)")
         print("0. Exit")
         
-        choice = input("\nEnter choice (0-6): ")
+        choice = input("\nEnter choice (0-7): ")
         
         if choice == '0':
             print("Exiting...")
             break
             
-        if choice not in ['1','2','3','4','5','6']:
+        if choice not in METHOD_PARAMS:
             print("Invalid choice.")
             continue
 
@@ -218,66 +646,50 @@ def main():
             f, expr = parse_function(func_str)
             if f is None: continue
             
-            tol = float(input("Enter tolerance (e.g., 0.0001): "))
-            max_iter = int(input("Enter max iterations (e.g., 50): "))
-            
-            result = None
-            history = []
-            error_msg = None
-
-            if choice == '1': # Bisection
-                a = float(input("Enter lower bound a: "))
-                b = float(input("Enter upper bound b: "))
-                result, history = bisection(f, a, b, tol, max_iter)
-                if result is None: error_msg = history
-
-            elif choice == '2': # Regula Falsi
-                a = float(input("Enter lower bound a: "))
-                b = float(input("Enter upper bound b: "))
-                result, history = regula_falsi(f, a, b, tol, max_iter)
-                if result is None: error_msg = history
-
-            elif choice == '3': # Secant
-                x0 = float(input("Enter first guess x0: "))
-                x1 = float(input("Enter second guess x1: "))
-                result, history = secant(f, x0, x1, tol, max_iter)
-                if result is None: error_msg = history
+            params = {}
+            params['tol'] = float(input("Enter tolerance (e.g., 0.0001): "))
+            params['max_iter'] = int(input("Enter max iterations (e.g., 50): "))
+
+            if choice in ('1', '2'): # Bisection, Regula Falsi
+                params['a'] = float(input("Enter lower bound a: "))
+                params['b'] = float(input("Enter upper bound b: "))
+
+            elif choice in ('3', '7'): # Secant, Auto
+                params['x0'] = float(input("Enter first guess x0: "))
+                params['x1'] = float(input("Enter second guess x1: "))
 
             elif choice == '4': # Newton Raphson
-                x0 = float(input("Enter initial guess x0: "))
-                df = get_derivative(expr)
-                print(f"Calculated Derivative: {sp.diff(expr, sp.symbols('x'))}")
-                result, history = newton_raphson(f, df, x0, tol, max_iter)
-                if result is None: error_msg = history
+                params['x0'] = float(input("Enter initial guess x0: "))
+                print(f"Calculated Derivative: {sp.diff(expr, X_SYM)}")
 
             elif choice == '5': # Fixed Point
-                x0 = float(input("Enter initial guess x0: "))
-                result, history = fixed_point(f, x0, tol, max_iter)
-                if result is None: error_msg = history
+                params['x0'] = float(input("Enter initial guess x0: "))
 
             elif choice == '6': # Modified Secant
-                x0 = float(input("Enter initial guess x0: "))
-                delta = float(input("Enter perturbation delta (e.g., 0.01): "))
-                result, history = modified_secant(f, x0, delta, tol, max_iter)
-                if result is None: error_msg = history
+                params['x0'] = float(input("Enter initial guess x0: "))
+                params['delta'] = float(input("Enter perturbation delta (e.g., 0.01): "))
+
+            result, history = dispatch(choice, func_str, params)
+            error_msg = history if result is None else None
 
             # Output
             if error_msg:
                 print(f"\nError: {error_msg}")
             else:
                 print(f"\nRoot found: {result:.6f}")
-                print(f"Iterations: {len(history)}")
-                print(f"Final Error: {history[-1]['error']:.6e}")
+                print(f"Iterations: {len(history['iter'])}")
+                print(f"Final Error: {history['error'][-1]:.6e}")
                 print("\nIteration Table:")
-                # Dynamic headers based on first row keys
-                headers = list(history[0].keys())
+                # History is column-oriented; zip the columns back into rows to print
+                headers = list(history.keys())
                 header_row = " | ".join([h.ljust(10) for h in headers])
+                # One template per table: str(), cut to 9 chars, padded to 10
+                row_fmt = " | ".join(["{!s:<10.9}"] * len(headers))
                 print("-" * len(header_row))
                 print(header_row)
                 print("-" * len(header_row))
-                for row in history:
-                    line = " | ".join([f"{str(val)[:9]}".ljust(10) for val in row.values()])
-                    print(line)
+                for row in zip(*history.values()):
+                    print(row_fmt.format(*row))
 
         except Exception as e:
             print(f"An error occurred: {e}")
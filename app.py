@@ -1,134 +1,522 @@
 from flask import Flask, render_template, request
+from collections import OrderedDict
 import sympy as sp
+import functools
+import linecache
 import math
+import numpy as np
+import os
+import threading
+
+try:
+    import symengine as se
+except ImportError:
+    se = None
+
+# The variable input functions are written in
+X_SYM = sp.symbols('x')
+
+# Below this size a lambdified function is cheaper to call than symengine's LLVM visitor
+SYMENGINE_MIN_OPS = 100
+
+# Expanded polynomials of at least this degree are evaluated in Horner form
+HORNER_MIN_DEGREE = 4
+
+# ZOF_BACKEND=autowrap compiles each function to a C extension with Cython (slow to build, fastest to call)
+ZOF_BACKEND = os.environ.get('ZOF_BACKEND', '').lower()
+
+# Compiled (f, expr) pairs by function string, kept across requests in LRU order
+FUNCTION_CACHE_SIZE = 512
+_FUNCTION_CACHE = OrderedDict()
+# Threaded workers share the cache; compiling happens outside the lock
+_FUNCTION_CACHE_LOCK = threading.Lock()
 
 app = Flask(__name__)
 
 # --- Math Logic (re-implemented/embedded for standalone deployment safety) ---
 
+def _lambdify_and_clean(args, expr, **kwargs):
+    # lambdify leaves each generated function's source in linecache.cache, which
+    # would grow with every new expression a long-running server compiles
+    f = sp.lambdify(args, expr, **kwargs)
+    linecache.cache.pop(f.__code__.co_filename, None)
+    return f
+
+def _autowrap(expr):
+    from sympy.utilities.autowrap import autowrap
+    # No tempdir: sympy builds in a temporary directory and removes it after import
+    return autowrap(expr, backend='cython', args=(X_SYM,))
+
+def _to_horner(expr):
+    # Expanded polynomials only: expanding a factored form would lose accuracy near its roots
+    if expr.is_polynomial(X_SYM) and sp.degree(expr, X_SYM) >= HORNER_MIN_DEGREE and expr == sp.expand(expr):
+        return sp.horner(expr)
+    return expr
+
+def _fold_constants(expr):
+    # Irrational constants only: evalf on the whole expression would turn sqrt(x)
+    # into x**0.5, which is complex for negative x
+    return expr.replace(lambda e: e.is_number and not e.is_Rational, lambda e: e.evalf())
+
+def _make_callable(*exprs):
+    # Several expressions give one callable returning a tuple, sharing subexpressions
+    # Fold constant subterms (e.g. sin(1)*exp(2)) into floats once
+    exprs = [_to_horner(_fold_constants(expr)) for expr in exprs]
+    body = exprs[0] if len(exprs) == 1 else tuple(exprs)
+    if ZOF_BACKEND == 'autowrap':
+        try:
+            wrapped = [_autowrap(expr) for expr in exprs]
+            if len(wrapped) == 1:
+                return wrapped[0]
+            return lambda v: tuple(g(v) for g in wrapped)
+        except Exception as e:
+            app.logger.warning("autowrap failed (%s), using the default backends.", e)
+    if se is not None and sum(sp.count_ops(expr) for expr in exprs) >= SYMENGINE_MIN_OPS:
+        try:
+            visitor = se.Lambdify([se.Symbol('x')], [se.sympify(expr) for expr in exprs], backend='llvm', cse=True)
+            if len(exprs) == 1:
+                return lambda v: visitor([v])[0]
+            return lambda v: tuple(visitor([v]))
+        except Exception:
+            pass
+    return _lambdify_and_clean(X_SYM, body, modules='math', cse=True)
+
 def parse_function(expr_str):
-    x = sp.symbols('x')
+    # Resubmitting a formula (e.g. while tuning the inputs) reuses its compiled function
+    with _FUNCTION_CACHE_LOCK:
+        if expr_str in _FUNCTION_CACHE:
+            _FUNCTION_CACHE.move_to_end(expr_str)
+            return _FUNCTION_CACHE[expr_str]
     try:
         expr = sp.sympify(expr_str)
-        f = sp.lambdify(x, expr, modules=['numpy', 'math'])
-        return f, expr
+        compiled = (_make_callable(expr), expr)
     except:
         return None, None
+    with _FUNCTION_CACHE_LOCK:
+        _FUNCTION_CACHE[expr_str] = compiled
+        if len(_FUNCTION_CACHE) > FUNCTION_CACHE_SIZE:
+            _FUNCTION_CACHE.popitem(last=False)
+    return compiled
 
+@functools.lru_cache(maxsize=256)
 def get_derivative(expr):
-    x = sp.symbols('x')
-    diff_expr = sp.diff(expr, x)
-    return sp.lambdify(x, diff_expr, modules=['numpy', 'math'])
+    diff_expr = sp.diff(expr, X_SYM)
+    # One callable returning (f(x), f'(x))
+    return _make_callable(expr, diff_expr)
 
-def run_method(method_id, params):
+# --- Batched solving: comma-separated inputs are solved together as numpy arrays ---
+
+# Inputs of each method that can be batched. The form also posts the fields it
+# hides for the chosen method, so only these decide whether a request is a batch
+BATCH_PARAMS = {
+    '1': ('param_a', 'param_b'), '2': ('param_a', 'param_b'),
+    '3': ('param_x0', 'param_x1'), '4': ('param_x0',),
+    '5': ('param_x0',), '6': ('param_x0', 'param_delta'),
+}
+
+@functools.lru_cache(maxsize=256)
+def _vectorize(expr):
+    f = _lambdify_and_clean(X_SYM, _to_horner(_fold_constants(expr)), modules='numpy', cse=True)
+    # Constant expressions come back as scalars, so broadcast to the input's shape
+    return lambda v: f(v) + np.zeros_like(v)
+
+def _batch_values(params, *names):
+    values = [np.array([float(v) for v in params.get(name).split(',')]) for name in names]
+    return [np.array(v, dtype=float) for v in np.broadcast_arrays(*values)]
+
+def run_batch(method_id, params):
     try:
         func_str = params.get('function')
         tol = float(params.get('tolerance'))
         max_iter = int(params.get('max_iter'))
-        
+
         f, expr = parse_function(func_str)
         if not f: return {"error": "Invalid Function String"}
+        f = _vectorize(expr)
+
+        if method_id in ('1', '2'):
+            a, b = _batch_values(params, 'param_a', 'param_b')
+            inputs = {'a': a, 'b': b}
+        elif method_id == '3':
+            x0, x1 = _batch_values(params, 'param_x0', 'param_x1')
+            inputs = {'x0': x0, 'x1': x1}
+        elif method_id == '6':
+            x0, delta = _batch_values(params, 'param_x0', 'param_delta')
+            inputs = {'x0': x0, 'delta': delta}
+        elif method_id in ('4', '5'):
+            x0, = _batch_values(params, 'param_x0')
+            inputs = {'x0': x0}
+        else:
+            return {"error": "Method not implemented"}
+
+        n = len(next(iter(inputs.values())))
+        roots = np.full(n, np.nan)
+        iters = np.full(n, max_iter)
+        status = np.full(n, '', dtype=object)
+        active = np.ones(n, dtype=bool)
+
+        def finish(mask, values, i, note='converged'):
+            mask = mask & active
+            roots[mask] = values[mask]
+            iters[mask] = i
+            status[mask] = note
+            active[mask] = False
+
+        def fail(mask, message, i):
+            mask = mask & active
+            status[mask] = message
+            iters[mask] = i
+            active[mask] = False
 
-        # Extract Method Specific Params
-        history = []
-        result = 0
-
-        if method_id == '1': # Bisection
-            a = float(params.get('param_a'))
-            b = float(params.get('param_b'))
-            
-            if f(a) * f(b) >= 0: return {"error": "f(a) and f(b) must have opposite signs"}
-            
-            for i in range(1, max_iter + 1):
-                c = (a + b) / 2
-                fc = f(c)
-                error = abs(b - a)
-                history.append({'iter': i, 'a': f"{a:.4f}", 'b': f"{b:.4f}", 'root': f"{c:.6f}", 'f_root': f"{fc:.6f}", 'error': f"{error:.6e}"})
-                if abs(fc) < tol or error < tol:
-                    return {"root": c, "history": history, "iters": i}
-                if f(a) * fc < 0: b = c
-                else: a = c
-            return {"root": (a+b)/2, "history": history, "iters": max_iter}
-
-        elif method_id == '2': # Regula Falsi
-            a = float(params.get('param_a'))
-            b = float(params.get('param_b'))
-            if f(a) * f(b) >= 0: return {"error": "f(a) and f(b) must have opposite signs"}
-            
-            for i in range(1, max_iter + 1):
+        with np.errstate(all='ignore'):
+            if method_id == '1': # Bisection
                 fa, fb = f(a), f(b)
-                if (fb - fa) == 0: return {"error": "Division by zero"}
-                c = (a * fb - b * fa) / (fb - fa)
-                fc = f(c)
-                error = abs(fc)
-                history.append({'iter': i, 'a': f"{a:.4f}", 'b': f"{b:.4f}", 'root': f"{c:.6f}", 'f_root': f"{fc:.6f}", 'error': f"{error:.6e}"})
-                if abs(fc) < tol: return {"root": c, "history": history, "iters": i}
-                if f(a) * fc < 0: b = c
-                else: a = c
-            return {"root": c, "history": history, "iters": max_iter}
-
-        elif method_id == '3': # Secant
-            x0 = float(params.get('param_x0'))
-            x1 = float(params.get('param_x1'))
-            
-            for i in range(1, max_iter + 1):
-                fx0, fx1 = f(x0), f(x1)
-                if (fx1 - fx0) == 0: return {"error": "Division by zero"}
-                x2 = x1 - (fx1 * (x1 - x0)) / (fx1 - fx0)
-                error = abs(x2 - x1)
-                history.append({'iter': i, 'x_prev': f"{x0:.4f}", 'x_curr': f"{x1:.4f}", 'root': f"{x2:.6f}", 'error': f"{error:.6e}"})
-                if error < tol: return {"root": x2, "history": history, "iters": i}
-                x0, x1 = x1, x2
-            return {"root": x1, "history": history, "iters": max_iter}
-
-        elif method_id == '4': # Newton
-            x0 = float(params.get('param_x0'))
-            df = get_derivative(expr)
-            x_curr = x0
-            
-            for i in range(1, max_iter + 1):
-                fx, dfx = f(x_curr), df(x_curr)
-                if dfx == 0: return {"error": "Derivative is zero"}
-                x_next = x_curr - (fx / dfx)
-                error = abs(x_next - x_curr)
-                history.append({'iter': i, 'x_curr': f"{x_curr:.4f}", 'f_x': f"{fx:.4f}", 'df_x': f"{dfx:.4f}", 'root': f"{x_next:.6f}", 'error': f"{error:.6e}"})
-                if error < tol: return {"root": x_next, "history": history, "iters": i}
-                x_curr = x_next
-            return {"root": x_curr, "history": history, "iters": max_iter}
-
-        elif method_id == '5': # Fixed Point
-            x0 = float(params.get('param_x0'))
-            x_curr = x0
-            
-            for i in range(1, max_iter + 1):
-                x_next = f(x_curr)
-                error = abs(x_next - x_curr)
-                history.append({'iter': i, 'x_curr': f"{x_curr:.4f}", 'g_x': f"{x_next:.6f}", 'error': f"{error:.6e}"})
-                if error < tol: return {"root": x_next, "history": history, "iters": i}
-                x_curr = x_next
-                if error > 1e10: return {"error": "Diverged"}
-            return {"root": x_curr, "history": history, "iters": max_iter}
-
-        elif method_id == '6': # Modified Secant
-            x0 = float(params.get('param_x0'))
-            delta = float(params.get('param_delta'))
-            x_curr = x0
-            
-            for i in range(1, max_iter + 1):
-                fx = f(x_curr)
-                fx_delta = f(x_curr + delta)
-                if (fx_delta - fx) == 0: return {"error": "Division by zero"}
-                x_next = x_curr - (delta * fx) / (fx_delta - fx)
-                error = abs(x_next - x_curr)
-                history.append({'iter': i, 'x_curr': f"{x_curr:.4f}", 'root': f"{x_next:.6f}", 'error': f"{error:.6e}"})
-                if error < tol: return {"root": x_next, "history": history, "iters": i}
-                x_curr = x_next
-            return {"root": x_curr, "history": history, "iters": max_iter}
+                # NaN, from an endpoint outside the domain, fails both "< 0" and ">= 0"
+                fail(np.isnan(fa * fb), "f(a) or f(b) is undefined", 0)
+                fail(~(fa * fb < 0), "f(a) and f(b) must have opposite signs", 0)
+                for i in range(1, max_iter + 1):
+                    if not active.any(): break
+                    c = (a + b) / 2
+                    fc = f(c)
+                    finish(np.minimum(np.abs(fc), np.abs(b - a)) < tol, c, i)
+                    left = fa * fc < 0
+                    b = np.where(active & left, c, b)
+                    a = np.where(active & ~left, c, a)
+                    fa = np.where(active & ~left, fc, fa)
+                finish(active, (a + b) / 2, max_iter, 'max iterations reached')
+
+            elif method_id == '2': # Regula Falsi
+                fa, fb = f(a), f(b)
+                fail(np.isnan(fa * fb), "f(a) or f(b) is undefined", 0)
+                fail(~(fa * fb < 0), "f(a) and f(b) must have opposite signs", 0)
+                c = a
+                for i in range(1, max_iter + 1):
+                    if not active.any(): break
+                    fail(fb - fa == 0, "Division by zero", i)
+                    c = np.where(active, (a * fb - b * fa) / (fb - fa), c)
+                    fc = f(c)
+                    finish(np.abs(fc) < tol, c, i)
+                    left = fa * fc < 0
+                    b, fb = np.where(active & left, c, b), np.where(active & left, fc, fb)
+                    a, fa = np.where(active & ~left, c, a), np.where(active & ~left, fc, fa)
+                finish(active, c, max_iter, 'max iterations reached')
+
+            elif method_id == '3': # Secant
+                for i in range(1, max_iter + 1):
+                    if not active.any(): break
+                    fx0, fx1 = f(x0), f(x1)
+                    fail(fx1 - fx0 == 0, "Division by zero", i)
+                    x2 = x1 - (fx1 * (x1 - x0)) / (fx1 - fx0)
+                    finish(np.abs(x2 - x1) < tol, x2, i)
+                    x0, x1 = np.where(active, x1, x0), np.where(active, x2, x1)
+                finish(active, x1, max_iter, 'max iterations reached')
+
+            elif method_id == '4': # Newton
+                df = _vectorize(sp.diff(expr, X_SYM))
+                x_curr = x0
+                for i in range(1, max_iter + 1):
+                    if not active.any(): break
+                    fx, dfx = f(x_curr), df(x_curr)
+                    fail(dfx == 0, "Derivative is zero", i)
+                    x_next = x_curr - (fx / dfx)
+                    finish(np.abs(x_next - x_curr) < tol, x_next, i)
+                    x_curr = np.where(active, x_next, x_curr)
+                finish(active, x_curr, max_iter, 'max iterations reached')
+
+            elif method_id == '5': # Fixed Point, with the scalar path's Aitken estimate
+                slope = np.abs(_vectorize(sp.diff(expr, X_SYM))(x0))
+                fail(slope >= 1, "Likely divergent: |g'(x0)| >= 1", 0)
+                x_prev, x_curr, acc_prev = np.full(n, np.nan), x0, np.full(n, np.nan)
+                for i in range(1, max_iter + 1):
+                    if not active.any(): break
+                    x_next = f(x_curr)
+                    denom = x_next - 2 * x_curr + x_prev
+                    x_acc = np.where(denom == 0, x_next, x_prev - (x_curr - x_prev) ** 2 / denom)
+                    step, acc_step = np.abs(x_next - x_curr), np.abs(x_acc - acc_prev)
+                    finish(step < tol, x_next, i)
+                    finish(acc_step < tol, x_acc, i)
+                    fail(step > 1e10, "Diverged", i)
+                    x_prev, acc_prev = np.where(active, x_curr, x_prev), np.where(active, x_acc, acc_prev)
+                    x_curr = np.where(active, x_next, x_curr)
+                finish(active, x_curr, max_iter, 'max iterations reached')
+
+            elif method_id == '6': # Modified Secant
+                x_curr = x0
+                for i in range(1, max_iter + 1):
+                    if not active.any(): break
+                    fx = f(x_curr)
+                    fx_delta = f(x_curr + delta)
+                    fail(fx_delta - fx == 0, "Division by zero", i)
+                    x_next = x_curr - (delta * fx) / (fx_delta - fx)
+                    finish(np.abs(x_next - x_curr) < tol, x_next, i)
+                    x_curr = np.where(active, x_next, x_curr)
+                finish(active, x_curr, max_iter, 'max iterations reached')
+
+            f_roots = f(roots)
+
+        has_root = ~np.isnan(roots)
+        batch = []
+        for k in range(n):
+            row = {'#': k + 1}
+            row.update({name: f"{values[k]:.4f}" for name, values in inputs.items()})
+            row['root'] = f"{roots[k]:.6f}" if has_root[k] else '-'
+            row['f_root'] = f"{f_roots[k]:.6e}" if has_root[k] else '-'
+            row['iters'] = int(iters[k])
+            row['status'] = status[k]
+            batch.append(row)
+        # Runs cut off at max_iter still report their last iterate, but aren't solved
+        solved = int((status == 'converged').sum())
+        return {"batch": batch, "solved": solved, "iters": int(iters.max())}
 
     except Exception as e:
         return {"error": str(e)}
 
-    return {"error": "Method not implemented"}
+# --- Scalar solving ---
+
+# Observed convergence order below which the Auto method's secant is considered stalled
+STALL_ORDER = 1.2
+
+def _convergence_order(errors):
+    e1, e2, e3 = errors[-3:]
+    # Only judge steps that are shrinking; growing ones say nothing about the order
+    if not e1 > e2 > e3 > 0: return None
+    return math.log(e3 / e2) / math.log(e2 / e1)
+
+# Display format per history column; anything not listed uses 4 decimals
+HISTORY_FORMATS = {'root': '{:.6f}', 'f_root': '{:.6f}', 'g_x': '{:.6f}', 'x_acc': '{:.6f}', 'error': '{:.6e}'}
+
+# Iteration tables start with at most this many columns and double as needed,
+# so a large max_iter doesn't allocate its whole history up front
+HISTORY_BLOCK = 1024
+
+def _new_table(ncols, max_iter):
+    return np.empty((ncols, min(max_iter, HISTORY_BLOCK)))
+
+def _grown(table):
+    bigger = np.empty((table.shape[0], 2 * table.shape[1]))
+    bigger[:, :table.shape[1]] = table
+    return bigger
+
+def _history(columns, table, n, **labels):
+    """Formats the first n iterations of a (columns x iterations) table for the template.
+
+    Extra keyword arguments are text columns, shown after the iteration number.
+    """
+    history = {'iter': list(range(1, n + 1))}
+    history.update({name: values[:n] for name, values in labels.items()})
+    for name, values in zip(columns, table[:, :n].tolist()):
+        fmt = HISTORY_FORMATS.get(name, '{:.4f}')
+        history[name] = [fmt.format(v) for v in values]
+    return history
+
+# Each method reads its own inputs from params and returns the result dict for the
+# template. Each row of table is one history column, filled in by iteration index.
+
+def _run_bisection(f, expr, params, tol, max_iter):
+    a = float(params.get('param_a'))
+    b = float(params.get('param_b'))
+
+    fa = f(a)
+    if fa * f(b) >= 0: return {"error": "f(a) and f(b) must have opposite signs"}
+
+    columns = ('a', 'b', 'root', 'f_root', 'error')
+    table = _new_table(5, max_iter)
+    for i in range(1, max_iter + 1):
+        c = (a + b) / 2
+        fc = f(c)
+        error = abs(b - a)
+        if i > table.shape[1]: table = _grown(table)
+        table[:, i - 1] = (a, b, c, fc, error)
+        if min(abs(fc), error) < tol:
+            return {"root": c, "history": _history(columns, table, i), "iters": i}
+        left = fa * fc < 0
+        b = c if left else b
+        a, fa = (a, fa) if left else (c, fc)
+    return {"root": (a+b)/2, "history": _history(columns, table, max_iter), "iters": max_iter}
+
+def _run_regula_falsi(f, expr, params, tol, max_iter):
+    a = float(params.get('param_a'))
+    b = float(params.get('param_b'))
+    fa, fb = f(a), f(b)
+    if fa * fb >= 0: return {"error": "f(a) and f(b) must have opposite signs"}
+
+    columns = ('a', 'b', 'root', 'f_root', 'error')
+    table = _new_table(5, max_iter)
+    for i in range(1, max_iter + 1):
+        if (fb - fa) == 0: return {"error": "Division by zero"}
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+        error = abs(fc)
+        if i > table.shape[1]: table = _grown(table)
+        table[:, i - 1] = (a, b, c, fc, error)
+        if abs(fc) < tol: return {"root": c, "history": _history(columns, table, i), "iters": i}
+        if fa * fc < 0: b, fb = c, fc
+        else: a, fa = c, fc
+    return {"root": c, "history": _history(columns, table, max_iter), "iters": max_iter}
+
+def _run_secant(f, expr, params, tol, max_iter):
+    x0 = float(params.get('param_x0'))
+    x1 = float(params.get('param_x1'))
+
+    columns = ('x_prev', 'x_curr', 'root', 'error')
+    table = _new_table(4, max_iter)
+    for i in range(1, max_iter + 1):
+        fx0, fx1 = f(x0), f(x1)
+        if (fx1 - fx0) == 0: return {"error": "Division by zero"}
+        x2 = x1 - (fx1 * (x1 - x0)) / (fx1 - fx0)
+        error = abs(x2 - x1)
+        if i > table.shape[1]: table = _grown(table)
+        table[:, i - 1] = (x0, x1, x2, error)
+        if error < tol: return {"root": x2, "history": _history(columns, table, i), "iters": i}
+        x0, x1 = x1, x2
+    return {"root": x1, "history": _history(columns, table, max_iter), "iters": max_iter}
+
+def _run_newton(f, expr, params, tol, max_iter):
+    x0 = float(params.get('param_x0'))
+    fdf = get_derivative(expr)
+    x_curr = x0
+    columns = ('x_curr', 'f_x', 'df_x', 'root', 'error')
+    table = _new_table(5, max_iter)
+    for i in range(1, max_iter + 1):
+        fx, dfx = fdf(x_curr)
+        if dfx == 0: return {"error": "Derivative is zero"}
+        x_next = x_curr - (fx / dfx)
+        error = abs(x_next - x_curr)
+        if i > table.shape[1]: table = _grown(table)
+        table[:, i - 1] = (x_curr, fx, dfx, x_next, error)
+        if error < tol: return {"root": x_next, "history": _history(columns, table, i), "iters": i}
+        x_curr = x_next
+    return {"root": x_curr, "history": _history(columns, table, max_iter), "iters": max_iter}
+
+def _run_fixed_point(f, expr, params, tol, max_iter):
+    x0 = float(params.get('param_x0'))
+    # Not a contraction at x0: refuse rather than burn max_iter iterations
+    try: slope = abs(float(sp.diff(expr, X_SYM).subs(X_SYM, x0)))
+    except (TypeError, ValueError): slope = None
+    if slope is not None and slope >= 1:
+        return {"error": f"Likely divergent: |g'(x0)| = {slope:.4g} >= 1, provide a contractive g(x)"}
+    x_prev, x_curr, acc_prev = math.nan, x0, math.nan
+    columns = ('x_curr', 'g_x', 'x_acc', 'error')
+    table = _new_table(4, max_iter)
+    for i in range(1, max_iter + 1):
+        x_next = f(x_curr)
+        # Aitken's delta-squared extrapolation of the last three plain iterates
+        denom = x_next - 2 * x_curr + x_prev
+        x_acc = x_next if denom == 0 else x_prev - (x_curr - x_prev) ** 2 / denom
+        step, acc_step = abs(x_next - x_curr), abs(x_acc - acc_prev)
+        error = acc_step if acc_step < step else step
+        if i > table.shape[1]: table = _grown(table)
+        table[:, i - 1] = (x_curr, x_next, x_acc, error)
+        if step < tol: return {"root": x_next, "history": _history(columns, table, i), "iters": i}
+        if acc_step < tol: return {"root": x_acc, "history": _history(columns, table, i), "iters": i}
+        x_prev, x_curr, acc_prev = x_curr, x_next, x_acc
+        if step > 1e10: return {"error": "Diverged"}
+    return {"root": x_curr, "history": _history(columns, table, max_iter), "iters": max_iter}
+
+def _run_modified_secant(f, expr, params, tol, max_iter):
+    x0 = float(params.get('param_x0'))
+    delta = float(params.get('param_delta'))
+    x_curr = x0
+    columns = ('x_curr', 'root', 'error')
+    table = _new_table(3, max_iter)
+    for i in range(1, max_iter + 1):
+        fx = f(x_curr)
+        fx_delta = f(x_curr + delta)
+        if (fx_delta - fx) == 0: return {"error": "Division by zero"}
+        x_next = x_curr - (delta * fx) / (fx_delta - fx)
+        error = abs(x_next - x_curr)
+        if i > table.shape[1]: table = _grown(table)
+        table[:, i - 1] = (x_curr, x_next, error)
+        if error < tol: return {"root": x_next, "history": _history(columns, table, i), "iters": i}
+        x_curr = x_next
+    return {"root": x_curr, "history": _history(columns, table, max_iter), "iters": max_iter}
+
+def _run_auto(f, expr, params, tol, max_iter):
+    # Auto: secant, switching to Newton when it stalls, bisecting when it overshoots
+    x0 = float(params.get('param_x0'))
+    x1 = float(params.get('param_x1'))
+    columns = ('x_curr', 'root', 'f_root', 'error')
+    table = _new_table(4, max_iter)
+    steps = []
+    errors = []
+    method = 'secant'
+    fx0, fx1 = f(x0), f(x1)
+    bracket = (x0, fx0, x1, fx1) if fx0 * fx1 < 0 else None
+    grew = False
+    newton_ok = True
+
+    for i in range(1, max_iter + 1):
+        if method == 'newton':
+            fx, dfx = fdf(x1)
+            if dfx == 0: return {"error": "Derivative is zero"}
+            x_next = x1 - (fx / dfx)
+        else:
+            if (fx1 - fx0) == 0: return {"error": "Division by zero"}
+            x_next = x1 - (fx1 * (x1 - x0)) / (fx1 - fx0)
+        error = abs(x_next - x1)
+        step = method
+        if bracket is not None:
+            a, fa, b, fb = bracket
+            # Leaving the known bracket, or |f| growing, means the fast step can't be trusted
+            if grew or not min(a, b) <= x_next <= max(a, b):
+                step = 'bisection'
+                x_next = (a + b) / 2
+                error = abs(b - a) / 2
+        f_next = f(x_next)
+        if i > table.shape[1]: table = _grown(table)
+        table[:, i - 1] = (x1, x_next, f_next, error)
+        steps.append(step)
+        if error < tol or f_next == 0: return {"root": x_next, "history": _history(columns, table, i, method=steps), "iters": i}
+
+        grew = step != 'bisection' and abs(f_next) > abs(fx1)
+        if grew and step == 'newton' and bracket is None and fx1 * f_next > 0:
+            # Nothing to bisect yet: drop the Newton step and go back to the secant
+            # from the last two points, for good
+            steps[-1] = 'rejected'
+            method, newton_ok, errors = 'secant', False, []
+            continue
+        if bracket is not None:
+            bracket = (a, fa, x_next, f_next) if fa * f_next < 0 else (x_next, f_next, b, fb)
+        elif fx1 * f_next < 0:
+            bracket = (x1, fx1, x_next, f_next)
+
+        errors = errors + [error] if step == method else []
+        if method == 'secant' and newton_ok and len(errors) >= 3:
+            q = _convergence_order(errors)
+            if q is not None and q < STALL_ORDER:
+                method = 'newton'
+                fdf = get_derivative(expr)
+        x0, fx0, x1, fx1 = x1, fx1, x_next, f_next
+    return {"root": x1, "history": _history(columns, table, max_iter, method=steps), "iters": max_iter}
+
+_METHODS = {
+    '1': _run_bisection, '2': _run_regula_falsi,
+    '3': _run_secant, '4': _run_newton,
+    '5': _run_fixed_point, '6': _run_modified_secant,
+    '7': _run_auto,
+}
+
+def run_method(method_id, params):
+    if any(',' in (params.get(name) or '') for name in BATCH_PARAMS.get(method_id, ())):
+        return run_batch(method_id, params)
+    if method_id == '7' and any(',' in (params.get(name) or '') for name in ('param_x0', 'param_x1')):
+        # Auto picks its steps per problem, so it has no batched version
+        return {"error": "Auto solves one problem at a time: enter a single x0 and x1"}
+
+    try:
+        func_str = params.get('function')
+        tol = float(params.get('tolerance'))
+        max_iter = int(params.get('max_iter'))
+        
+        f, expr = parse_function(func_str)
+        if not f: return {"error": "Invalid Function String"}
+
+        run = _METHODS.get(method_id)
+        if run is None: return {"error": "Method not implemented"}
+        return run(f, expr, params, tol, max_iter)
+
+    except Exception as e:
+        return {"error": str(e)}
 
 # --- Routes ---
 
@@ -0,0 +1,119 @@
+"""Tests for the CLI's method dispatch and batch mode.
+
+Run from the repository root with: python -m unittest discover tests
+"""
+import contextlib
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import ZOF_CLI
+
+ROOT = 1.5213797068  # Real root of x**3 - x - 2
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class DispatchTest(unittest.TestCase):
+
+    def solve(self, method, func_str, **params):
+        params.setdefault('tol', 1e-10)
+        params.setdefault('max_iter', 100)
+        return ZOF_CLI.dispatch(method, func_str, params)
+
+    def test_every_method_finds_the_root(self):
+        cases = {
+            '1': ('x**3 - x - 2', {'a': 1, 'b': 2}),
+            '2': ('x**3 - x - 2', {'a': 1, 'b': 2}),
+            '3': ('x**3 - x - 2', {'x0': 1, 'x1': 2}),
+            '4': ('x**3 - x - 2', {'x0': 1.5}),
+            '5': ('(x + 2)**(1/3)', {'x0': 1.5}),  # x = g(x) rearranged from x**3 - x - 2
+            '6': ('x**3 - x - 2', {'x0': 1.5, 'delta': 0.01}),
+            '7': ('x**3 - x - 2', {'x0': 1, 'x1': 2}),
+        }
+        self.assertEqual(set(cases), set(ZOF_CLI.METHOD_PARAMS))
+        for method, (func_str, params) in cases.items():
+            with self.subTest(method=method):
+                root, history = self.solve(method, func_str, **params)
+                self.assertIsNotNone(root, history)
+                self.assertAlmostEqual(float(root), ROOT, places=6)
+                self.assertGreater(len(history['iter']), 0)
+
+    def test_numeric_strings_are_accepted(self):
+        root, _ = self.solve('1', 'x**3 - x - 2', a='1', b='2', tol='1e-10', max_iter='100')
+        self.assertAlmostEqual(float(root), ROOT, places=6)
+
+    def test_error_messages(self):
+        cases = [
+            (('9', 'x', {}), "Unknown method '9'."),
+            (('1', 'x**', {'a': 1, 'b': 2}), "Invalid function."),
+            (('6', 'x**3 - x - 2', {'x0': 1.5}), "Missing input 'delta' for method 6."),
+            (('1', 'x**3 - x - 2', {'a': '', 'b': 2}), "Missing input 'a' for method 1."),
+            (('1', 'x**3 - x - 2', {'a': 2, 'b': 3}),
+             "Bisection fails: f(a) and f(b) must have opposite signs."),
+            (('2', 'x**3 - x - 2', {'a': 2, 'b': 3}),
+             "Regula Falsi fails: f(a) and f(b) must have opposite signs."),
+            (('3', '5', {'x0': 1, 'x1': 2}), "Division by zero: f(x1) - f(x0) is zero."),
+            (('4', 'x**2 + 1', {'x0': 0}), "Derivative is zero. Method fails."),
+            (('5', '2*x - 1', {'x0': 0}),
+             "Likely divergent: |g'(x0)| = 2 >= 1, provide a contractive g(x)."),
+            (('6', '5', {'x0': 1, 'delta': 0.01}), "Division by zero in Modified Secant."),
+        ]
+        for (method, func_str, params), message in cases:
+            with self.subTest(method=method, function=func_str), contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(self.solve(method, func_str, **params), (None, message))
+
+    def test_missing_tolerance(self):
+        self.assertEqual(ZOF_CLI.dispatch('4', 'x', {'x0': 1, 'max_iter': 10}),
+                         (None, "Missing input 'tol' for method 4."))
+
+
+class BatchTest(unittest.TestCase):
+
+    PROBLEMS = [
+        {'method': '1', 'function': 'x**3 - x - 2', 'tol': '1e-10', 'max_iter': '100', 'a': '1', 'b': '2'},
+        {'method': '4', 'function': 'x**3 - x - 2', 'tol': '1e-10', 'max_iter': '100', 'x0': '1.5'},
+        {'method': '6', 'function': 'x**3 - x - 2', 'tol': '1e-10', 'max_iter': '100', 'x0': '1.5'},
+    ]
+
+    def check_rows(self, rows):
+        self.assertEqual(len(rows), 3)
+        for row in rows[:2]:
+            self.assertEqual(row['error'], '')
+            self.assertAlmostEqual(float(row['root']), ROOT, places=6)
+            self.assertGreater(int(row['iterations']), 0)
+        self.assertEqual(rows[2]['root'], '')
+        self.assertEqual(rows[2]['error'], "Missing input 'delta' for method 6.")
+
+    def run_cli(self, path):
+        result = subprocess.run([sys.executable, 'ZOF_CLI.py', '--batch', path], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True)
+        return list(csv.DictReader(io.StringIO(result.stdout)))
+
+    def test_csv_round_trip(self):
+        fields = ['method', 'function', 'tol', 'max_iter', 'a', 'b', 'x0']
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'problems.csv')
+            with open(path, 'w', newline='') as fh:
+                writer = csv.DictWriter(fh, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(self.PROBLEMS)
+            rows = self.run_cli(path)
+        self.assertEqual([row['method'] for row in rows], ['1', '4', '6'])
+        self.check_rows(rows)
+
+    def test_json_lines_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'problems.jsonl')
+            with open(path, 'w') as fh:
+                fh.writelines(json.dumps(problem) + '\n' for problem in self.PROBLEMS)
+            rows = self.run_cli(path)
+        self.check_rows(rows)
+
+
+if __name__ == '__main__':
+    unittest.main()